@@ -0,0 +1,73 @@
+import math
+from numba import njit
+
+# Scalar solar-geometry kernels, JIT-compiled once and cached on disk by Numba.
+# Re-exported through core.solar_model, which is the public interface.
+
+@njit(cache=True, fastmath=True)
+def clip_unit(x: float) -> float:
+    """Clamp x to [-1, 1] before acos; compiles to branchless min/max under Numba."""
+    return min(1.0, max(-1.0, x))
+
+@njit(cache=True, fastmath=True)
+def equation_of_time(n: int) -> float:
+    """Calculate Equation of Time (EoT) in minutes given day of year n."""
+    B = math.radians((n - 1) * 360.0 / 365.0)
+    # One sin/cos pair of B; the 2B terms follow from the double-angle identities
+    sin_b = math.sin(B)
+    cos_b = math.cos(B)
+    sin_2b = 2.0 * sin_b * cos_b
+    cos_2b = cos_b * cos_b - sin_b * sin_b
+    eot = 229.18 * (
+        0.000075 
+        + 0.001868 * cos_b 
+        - 0.032077 * sin_b 
+        - 0.014615 * cos_2b 
+        - 0.040849 * sin_2b
+    )
+    return eot
+
+@njit(cache=True, fastmath=True)
+def solar_declination(n: int) -> float:
+    """Calculate Solar Declination (δ) in degrees."""
+    angle_rad = math.radians((360.0 / 365.0) * (284 + n))
+    return 23.45 * math.sin(angle_rad)
+
+@njit(cache=True, fastmath=True)
+def zenith_and_azimuth(latitude: float, declination: float, hour_angle_deg: float) -> tuple[float, float]:
+    """Calculate Solar Zenith Angle (θz) and Azimuth Angle (γ) in degrees."""
+    lat_rad = math.radians(latitude)
+    dec_rad = math.radians(declination)
+    h_rad = math.radians(hour_angle_deg)
+
+    # Each sin/cos pair is evaluated once and shared by the zenith and azimuth formulas
+    sin_lat, cos_lat = math.sin(lat_rad), math.cos(lat_rad)
+    sin_dec, cos_dec = math.sin(dec_rad), math.cos(dec_rad)
+    cos_h = math.cos(h_rad)
+
+    # Zenith Angle
+    cos_theta_z = sin_lat * sin_dec + cos_lat * cos_dec * cos_h
+    cos_theta_z = clip_unit(cos_theta_z) # Clamping to avoid domain errors
+    zenith_rad = math.acos(cos_theta_z)
+    zenith_deg = math.degrees(zenith_rad)
+
+    # Azimuth Angle
+    # cos(γ) = (sin(δ) cos(φ) - cos(δ) sin(φ) cos(H)) / sin(θz)
+    # Alternatively: cos(γ) = (sin(α)sin(φ) - sin(δ)) / (cos(α)cos(φ)) where α = 90 - θz
+    elevation_rad = math.pi / 2 - zenith_rad
+    
+    sin_theta_z = math.sqrt(1.0 - cos_theta_z * cos_theta_z) # θz is in [0, π], so sin(θz) >= 0
+    if sin_theta_z > 0.001:
+        cos_gamma = (sin_dec * cos_lat - cos_dec * sin_lat * cos_h) / sin_theta_z
+        cos_gamma = clip_unit(cos_gamma)
+        azimuth_rad = math.acos(cos_gamma)
+        azimuth_deg = math.degrees(azimuth_rad)
+        
+        # Adjust based on hour angle for true azimuth (relative to South or North depending on convention)
+        if hour_angle_deg > 0:
+            azimuth_deg = 360 - azimuth_deg
+    else:
+        # Sun is at zenith
+        azimuth_deg = 0.0
+
+    return zenith_deg, azimuth_deg
@@ -1,13 +1,30 @@
 import numpy as np
-from sklearn.ensemble import RandomForestRegressor
 from datetime import datetime
 
+def predict_analytical(zenith, cloud_cover):
+    """
+    Closed-form irradiance (W/m^2): clear-sky 1000*cos(zenith), reduced by up to 70% under
+    full cloud cover, 0 once the Sun is below the horizon. Works on scalars or arrays.
+    """
+    return np.where(
+        zenith > 90, 0,
+        1000 * np.cos(np.radians(zenith)) * (1 - (cloud_cover / 100.0) * 0.7)
+    )
+
 class IrradiancePredictor:
+    # Feature ranges (hour, temp, cloud_cover, zenith_angle) covered by the quantized lookup table
+    LUT_RANGES = ((0.0, 24.0), (-10.0, 45.0), (0.0, 100.0), (0.0, 180.0))
+
     def __init__(self):
-        # We use a Random Forest model as a baseline for AI prediction
-        self.model = RandomForestRegressor(n_estimators=100, random_state=42)
+        # Until a model is trained, predictions come from the closed-form predict_analytical
+        self.model = None
         self.is_trained = False
         
+        # Quantized lookup table (see quantize), used for inference instead of the model once built
+        self.lut = None
+        self.lut_scale = 1.0
+        self.lut_offset = 0.0
+        
     def train(self, history_data: dict):
         """
         Train the model using historical weather and irradiance data.
@@ -17,35 +34,80 @@ class IrradiancePredictor:
         """
         X = np.array(history_data['features'])
         y = np.array(history_data['target'])
-        self.model.fit(X, y)
-        self.is_trained = True
+        self._fit(X, y)
+        self.lut = None # A table built from the previous model is stale now
         
     def train_synthetic(self):
         """Applies a synthetic dataset to train the model for simulation."""
-        np.random.seed(42)
+        rng = np.random.default_rng(42) # Local generator, leaves the global NumPy seed untouched
         # Synthetic data: 1000 samples
-        hours = np.random.uniform(0, 24, 1000)
-        temps = np.random.uniform(-10, 45, 1000)
-        cloud_covers = np.random.uniform(0, 100, 1000)
-        zenith = np.random.uniform(0, 180, 1000)
-        
-        # Fake irradiance function: peaks at noon (hour 12), lower with high cloud cover, 0 if zenith > 90
-        irradiance = np.where(
-            zenith > 90, 0,
-            1000 * np.cos(np.radians(zenith)) * (1 - (cloud_covers / 100.0) * 0.7)
-        )
-        irradiance = np.maximum(0, irradiance + np.random.normal(0, 20, 1000))
+        hours = rng.uniform(0, 24, 1000)
+        temps = rng.uniform(-10, 45, 1000)
+        cloud_covers = rng.uniform(0, 100, 1000)
+        zenith = rng.uniform(0, 180, 1000)
+        
+        # Fake irradiance function: the analytical model plus sensor noise
+        irradiance = predict_analytical(zenith, cloud_covers)
+        irradiance = np.maximum(0, irradiance + rng.normal(0, 20, 1000))
         
         features = np.column_stack((hours, temps, cloud_covers, zenith))
         target = irradiance
         
-        self.model.fit(features, target)
+        self._fit(features, target)
+
+    def _fit(self, X: np.ndarray, y: np.ndarray):
+        # Imported here so that sklearn (and scipy) only load when a model is actually trained
+        from sklearn.ensemble import HistGradientBoostingRegressor
+
+        # Small gradient-boosted model: shallow trees on binned features keep inference cheap enough for the edge
+        self.model = HistGradientBoostingRegressor(max_iter=50, max_depth=4, random_state=42)
+        self.model.fit(X, y)
         self.is_trained = True
+        self.lut = None # A table built from the previous model is stale now
+
+    def quantize(self, bins: tuple = (16, 8, 16, 32)):
+        """
+        Distill the current predictor (trained model, or the analytical one) into a uint8 lookup
+        table over a fixed feature grid (hour x temp x cloud_cover x zenith, 64 KB with the
+        default bins) for edge deployment.
+        Predictions then become a table gather plus a scale/offset instead of tree walks.
+        """
+        # Sample the predictor at the centre of every grid cell
+        centres = [lo + (np.arange(n) + 0.5) * (hi - lo) / n for (lo, hi), n in zip(self.LUT_RANGES, bins)]
+        grid = np.stack(np.meshgrid(*centres, indexing="ij"), axis=-1).reshape(-1, len(bins))
+        values = self._predict_model(grid)
+        
+        # Affine uint8 quantization: value ~= code * scale + offset
+        self.lut_offset = float(values.min())
+        self.lut_scale = max(float(values.max()) - self.lut_offset, 1e-9) / 255.0
+        codes = np.round((values - self.lut_offset) / self.lut_scale)
+        self.lut = codes.astype(np.uint8).reshape(bins)
 
     def predict(self, hour: float, temp: float, cloud_cover: float, zenith_angle: float) -> float:
+        return self.predict_many([[hour, temp, cloud_cover, zenith_angle]])[0]
+
+    def predict_many(self, features) -> np.ndarray:
+        """
+        Predict irradiance for a batch of samples in a single model call.
+        features: [[hour, temp, cloud_cover, zenith_angle], ...]
+        """
+        features = np.asarray(features, dtype=float)
+        if self.lut is not None:
+            return self._predict_lut(features)
+        return self._predict_model(features)
+
+    def _predict_model(self, features: np.ndarray) -> np.ndarray:
         if not self.is_trained:
-            self.train_synthetic() # Auto-train on synthetic if not trained
-        return self.model.predict([[hour, temp, cloud_cover, zenith_angle]])[0]
+            return predict_analytical(features[:, 3], features[:, 2]) # No model needed for the closed form
+        return self.model.predict(features)
+
+    def _predict_lut(self, features: np.ndarray) -> np.ndarray:
+        """Look predictions up in the quantized table; out-of-range features clamp to the edge cells."""
+        lo, hi = np.array(self.LUT_RANGES).T
+        bins = np.array(self.lut.shape)
+        cells = np.clip(((features - lo) / (hi - lo) * bins).astype(np.intp), 0, bins - 1)
+        codes = self.lut.take(np.ravel_multi_index(cells.T, self.lut.shape))
+        return codes * self.lut_scale + self.lut_offset
 
 
 class PredictiveController:
@@ -65,27 +127,8 @@ class PredictiveController:
         # Predict irradiance (W/m^2) based on weather
         predicted_irradiance = self.predictor.predict(hour, temp, cloud_cover, zenith)
         
-        # Calculate expected power (W) with and without moving
-        # Simplifying assumption: power = irradiance * area * efficiency * cos(incidence_angle)
-        # Moving perfectly means incidence_angle = 0 -> cos(0) = 1
-        # Not moving means incidence_angle is the difference between current and target angles.
-        
-        expected_power_moving = predicted_irradiance * area * efficiency
-        
-        tilt_diff_rad = np.radians(target_tilt - current_tilt)
-        az_diff_rad = np.radians(target_azimuth - current_azimuth)
-        
-        # Approximate incidence angle cosine using dot product of normal vectors
-        # For simplicity, if we don't move, we suffer a cosine loss
-        incidence_cos = max(0.0, np.cos(tilt_diff_rad) * np.cos(az_diff_rad))
-        expected_power_staying = predicted_irradiance * area * efficiency * incidence_cos
-        
-        # Expected energy gain in roughly 10 minutes (0.166 hours)
-        time_delta_h = 10.0 / 60.0 
-        expected_energy_moving_wh = expected_power_moving * time_delta_h
-        expected_energy_staying_wh = expected_power_staying * time_delta_h
-        
-        energy_gain = expected_energy_moving_wh - expected_energy_staying_wh
+        energy_gain = self._energy_gain(predicted_irradiance, current_tilt, target_tilt,
+                                        current_azimuth, target_azimuth, area, efficiency)
         
         # If the energy gain by moving is LESS than what the motors will consume, do not move.
         if energy_gain <= self.motor_energy_cost:
@@ -105,3 +148,54 @@ class PredictiveController:
             "final_azimuth": target_azimuth
         }
 
+    def optimize_movements(self, current_tilt, target_tilt, current_azimuth, target_azimuth,
+                           hours, temps, cloud_covers, zeniths,
+                           area: float = 2.0, efficiency: float = 0.2) -> dict:
+        """
+        Batched version of optimize_movement for a series of tracker ticks.
+        All angle and weather arguments are arrays (or scalars) of the same length;
+        irradiance is predicted for every tick with a single model call.
+        Returns a dict of arrays.
+        """
+        features = np.column_stack(np.broadcast_arrays(hours, temps, cloud_covers, zeniths)).astype(float)
+        predicted_irradiance = self.predictor.predict_many(features)
+
+        energy_gain = self._energy_gain(predicted_irradiance, current_tilt, target_tilt,
+                                        current_azimuth, target_azimuth, area, efficiency)
+
+        # Same rule as optimize_movement: only move if the gain beats the motor cost
+        move_approved = energy_gain > self.motor_energy_cost
+        return {
+            "move_approved": move_approved,
+            "energy_gain": energy_gain,
+            "predicted_irradiance": predicted_irradiance,
+            "final_tilt": np.where(move_approved, target_tilt, current_tilt),
+            "final_azimuth": np.where(move_approved, target_azimuth, current_azimuth)
+        }
+
+    @staticmethod
+    def _energy_gain(predicted_irradiance, current_tilt, target_tilt,
+                     current_azimuth, target_azimuth, area, efficiency):
+        """Expected energy gain (Wh) of moving vs. staying over the next ~10 minutes. Works on scalars or arrays."""
+        # Calculate expected power (W) with and without moving
+        # Simplifying assumption: power = irradiance * area * efficiency * cos(incidence_angle)
+        # Moving perfectly means incidence_angle = 0 -> cos(0) = 1
+        # Not moving means incidence_angle is the difference between current and target angles.
+        
+        expected_power_moving = predicted_irradiance * area * efficiency
+        
+        tilt_diff_rad = np.radians(np.subtract(target_tilt, current_tilt))
+        az_diff_rad = np.radians(np.subtract(target_azimuth, current_azimuth))
+        
+        # Approximate incidence angle cosine using dot product of normal vectors
+        # For simplicity, if we don't move, we suffer a cosine loss
+        incidence_cos = np.maximum(0.0, np.cos(tilt_diff_rad) * np.cos(az_diff_rad))
+        expected_power_staying = predicted_irradiance * area * efficiency * incidence_cos
+        
+        # Expected energy gain in roughly 10 minutes (0.166 hours)
+        time_delta_h = 10.0 / 60.0 
+        expected_energy_moving_wh = expected_power_moving * time_delta_h
+        expected_energy_staying_wh = expected_power_staying * time_delta_h
+        
+        return expected_energy_moving_wh - expected_energy_staying_wh
+
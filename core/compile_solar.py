@@ -0,0 +1,23 @@
+"""
+Ahead-of-time build of the solar geometry kernels.
+
+Run once at install/build time (needs Numba and a C compiler):
+    python -m core.compile_solar
+
+This writes a `solar_kernels` extension module next to this file. core.solar_model
+imports it when present, so the first simulation pays no JIT compile or cache-load cost.
+"""
+import os
+from numba.pycc import CC
+from core import _solar_numba
+
+cc = CC("solar_kernels")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Export the plain Python bodies of the JIT kernels with fixed signatures
+cc.export("equation_of_time", "f8(i8)")(_solar_numba.equation_of_time.py_func)
+cc.export("solar_declination", "f8(i8)")(_solar_numba.solar_declination.py_func)
+cc.export("zenith_and_azimuth", "UniTuple(f8, 2)(f8, f8, f8)")(_solar_numba.zenith_and_azimuth.py_func)
+
+if __name__ == "__main__":
+    cc.compile()
@@ -1,26 +1,25 @@
-import math
+import os
+import warnings
+import numpy as np
 from datetime import datetime, timedelta
+from functools import lru_cache
+from importlib.util import find_spec
 
-def equation_of_time(n: int) -> float:
-    """Calculate Equation of Time (EoT) in minutes given day of year n."""
-    B = math.radians((n - 1) * 360.0 / 365.0)
-    eot = 229.18 * (
-        0.000075 
-        + 0.001868 * math.cos(B) 
-        - 0.032077 * math.sin(B) 
-        - 0.014615 * math.cos(2 * B) 
-        - 0.040849 * math.sin(2 * B)
-    )
-    return eot
+# Prefer the ahead-of-time build (python -m core.compile_solar) so Numba is not even imported.
+# A build older than the kernel source is stale and ignored in favour of the JIT kernels.
+_aot_spec = find_spec(".solar_kernels", __package__)
+_kernel_source = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_solar_numba.py")
+if _aot_spec is not None and os.path.getmtime(_aot_spec.origin) >= os.path.getmtime(_kernel_source):
+    from .solar_kernels import equation_of_time, solar_declination, zenith_and_azimuth
+else:
+    if _aot_spec is not None:
+        warnings.warn("core/solar_kernels is older than core/_solar_numba.py and is ignored; "
+                      "rebuild it with: python -m core.compile_solar")
+    from ._solar_numba import equation_of_time, solar_declination, zenith_and_azimuth
 
 def get_day_of_year(dt: datetime) -> int:
     return dt.timetuple().tm_yday
 
-def solar_declination(n: int) -> float:
-    """Calculate Solar Declination (δ) in degrees."""
-    angle_rad = math.radians((360.0 / 365.0) * (284 + n))
-    return 23.45 * math.sin(angle_rad)
-
 def standard_meridian(utc_offset_hours: float) -> float:
     """Calculate standard meridian longitude."""
     return utc_offset_hours * 15.0
@@ -36,10 +35,15 @@ def solar_time_correction(longitude: float, utc_offset_hours: float, n: int) ->
     tc = 4.0 * (longitude - lambda_std) + eot
     return tc
 
+@lru_cache(maxsize=64)
+def daily_solar_constants(n: int, longitude: float, utc_offset_hours: float) -> tuple[float, float]:
+    """Declination (degrees) and Time Correction (minutes), both fixed for a given day and site."""
+    return solar_declination(n), solar_time_correction(longitude, utc_offset_hours, n)
+
 def calculate_solar_time(dt_local: datetime, longitude: float, utc_offset_hours: float) -> float:
     """Calculate Solar Time in fractional hours."""
     n = get_day_of_year(dt_local)
-    tc_minutes = solar_time_correction(longitude, utc_offset_hours, n)
+    _, tc_minutes = daily_solar_constants(n, longitude, utc_offset_hours)
     local_time_hours = dt_local.hour + dt_local.minute / 60.0 + dt_local.second / 3600.0
     solar_time_hours = local_time_hours + tc_minutes / 60.0
     
@@ -52,43 +56,58 @@ def hour_angle(solar_time_hours: float) -> float:
     # H = 15°(SolarTime − 12)
     return 15.0 * (solar_time_hours - 12.0)
 
-def zenith_and_azimuth(latitude: float, declination: float, hour_angle_deg: float) -> tuple[float, float]:
-    """Calculate Solar Zenith Angle (θz) and Azimuth Angle (γ) in degrees."""
-    lat_rad = math.radians(latitude)
-    dec_rad = math.radians(declination)
-    h_rad = math.radians(hour_angle_deg)
+def _zenith_and_azimuth_from_trig(sin_lat, cos_lat, sin_dec, cos_dec, hour_angle_deg) -> tuple[np.ndarray, np.ndarray]:
+    """Zenith and azimuth (degrees) from precomputed latitude/declination sines and cosines."""
+    cos_h = np.cos(np.radians(hour_angle_deg))
 
     # Zenith Angle
-    cos_theta_z = math.sin(lat_rad) * math.sin(dec_rad) + math.cos(lat_rad) * math.cos(dec_rad) * math.cos(h_rad)
-    cos_theta_z = max(-1.0, min(1.0, cos_theta_z)) # Clamping to avoid domain errors
-    zenith_rad = math.acos(cos_theta_z)
-    zenith_deg = math.degrees(zenith_rad)
-
-    # Azimuth Angle
-    # cos(γ) = (sin(δ) cos(φ) - cos(δ) sin(φ) cos(H)) / sin(θz)
-    # Alternatively: cos(γ) = (sin(α)sin(φ) - sin(δ)) / (cos(α)cos(φ)) where α = 90 - θz
-    elevation_rad = math.pi / 2 - zenith_rad
-    
-    sin_theta_z = math.sin(zenith_rad)
-    if sin_theta_z > 0.001:
-        cos_gamma = (math.sin(dec_rad) * math.cos(lat_rad) - math.cos(dec_rad) * math.sin(lat_rad) * math.cos(h_rad)) / sin_theta_z
-        cos_gamma = max(-1.0, min(1.0, cos_gamma))
-        azimuth_rad = math.acos(cos_gamma)
-        azimuth_deg = math.degrees(azimuth_rad)
-        
-        # Adjust based on hour angle for true azimuth (relative to South or North depending on convention)
-        if hour_angle_deg > 0:
-            azimuth_deg = 360 - azimuth_deg
-    else:
-        # Sun is at zenith
-        azimuth_deg = 0.0
+    cos_theta_z = np.clip(sin_lat * sin_dec + cos_lat * cos_dec * cos_h, -1.0, 1.0)
+    zenith_deg = np.degrees(np.arccos(cos_theta_z))
+
+    # Azimuth Angle (0 where the Sun is at zenith, same as the scalar version)
+    sin_theta_z = np.sqrt(1.0 - cos_theta_z * cos_theta_z)
+    cos_gamma = np.asarray(sin_dec * cos_lat - cos_dec * sin_lat * cos_h)
+    has_azimuth = sin_theta_z > 0.001
+    np.divide(cos_gamma, sin_theta_z, out=cos_gamma, where=has_azimuth)
+    azimuth_deg = np.degrees(np.arccos(np.clip(cos_gamma, -1.0, 1.0)))
+    azimuth_deg = np.where(hour_angle_deg > 0, 360 - azimuth_deg, azimuth_deg)
+    azimuth_deg[~has_azimuth] = 0.0
 
     return zenith_deg, azimuth_deg
 
+def zenith_and_azimuth_array(latitude, declination: float, hour_angle_deg: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Array version of zenith_and_azimuth; latitude and hour angle may be arrays and are broadcast."""
+    lat_rad = np.radians(latitude)
+    dec_rad = np.radians(declination)
+    return _zenith_and_azimuth_from_trig(np.sin(lat_rad), np.cos(lat_rad), np.sin(dec_rad), np.cos(dec_rad), hour_angle_deg)
+
+def make_angle_solver(latitude: float, longitude: float, utc_offset_hours: float, date_obj: datetime):
+    """
+    Specialize the solar geometry for one site and day.
+    Returns solve(hour_frac) -> (tilt, azimuth, zenith) for local clock hours (scalar or array),
+    with the latitude/declination trig and the time correction computed once up front.
+    """
+    declination, tc_minutes = daily_solar_constants(get_day_of_year(date_obj), longitude, utc_offset_hours)
+    lat_rad = np.radians(latitude)
+    dec_rad = np.radians(declination)
+    sin_lat, cos_lat = np.sin(lat_rad), np.cos(lat_rad)
+    sin_dec, cos_dec = np.sin(dec_rad), np.cos(dec_rad)
+    tc_hours = tc_minutes / 60.0
+
+    def solve(hour_frac):
+        solar_time = (hour_frac + tc_hours) % 24
+        zenith, azimuth = _zenith_and_azimuth_from_trig(sin_lat, cos_lat, sin_dec, cos_dec, hour_angle(solar_time))
+        # [()] turns 0-d results back into scalars for scalar input (arrays pass through)
+        zenith, azimuth = np.asarray(zenith)[()], np.asarray(azimuth)[()]
+        # Tilt angle (β) = Zenith angle (θz) for optimal tracking, as its own copy
+        return zenith.copy(), azimuth, zenith
+
+    return solve
+
 def get_target_angles(dt_local: datetime, latitude: float, longitude: float, utc_offset_hours: float) -> dict:
     """Compute optimal tilt (β) and azimuth (γ) for dual-axis tracking."""
     n = get_day_of_year(dt_local)
-    declination = solar_declination(n)
+    declination, _ = daily_solar_constants(n, longitude, utc_offset_hours)
     solar_time = calculate_solar_time(dt_local, longitude, utc_offset_hours)
     h_deg = hour_angle(solar_time)
     
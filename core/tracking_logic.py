@@ -1,6 +1,9 @@
+import numpy as np
 from typing import Dict, Any
 from datetime import datetime
-from .solar_model import get_target_angles
+from .solar_model import (
+    get_target_angles, get_day_of_year, solar_declination, solar_time_correction, hour_angle, zenith_and_azimuth_array
+)
 
 class DualAxisTracker:
     def __init__(self, latitude: float, longitude: float, utc_offset_hours: float):
@@ -12,6 +15,7 @@ class DualAxisTracker:
         self.current_tilt = 0.0
         self.current_azimuth = 0.0
         self.last_update_time = None
+        self.last_update_minute = None
         self.is_winter_mode_active = False
 
     def update(self, dt_local: datetime, temperature_c: float, snow_detected: bool, min_update_interval_minutes: int = 10) -> Dict[str, Any]:
@@ -19,6 +23,17 @@ class DualAxisTracker:
         Calculates the new target angles.
         Returns the command for the actuators.
         """
+        # Minutes since 0001-01-01, so the interval check also works across midnight
+        minute = dt_local.toordinal() * 1440 + dt_local.hour * 60 + dt_local.minute + dt_local.second / 60.0
+        return self.update_fast(minute, dt_local, temperature_c, snow_detected, min_update_interval_minutes)
+
+    def update_fast(self, minute: float, dt_local: datetime, temperature_c: float, snow_detected: bool,
+                    min_update_interval_minutes: int = 10) -> Dict[str, Any]:
+        """
+        Same as update, but the caller passes its own monotonic minute counter (e.g. the
+        simulation minute) so the interval check is plain number arithmetic.
+        Don't mix counters: use either update or update_fast on a given tracker.
+        """
         # Winter mode check
         self.is_winter_mode_active = (temperature_c < 2.0) and snow_detected
         
@@ -26,9 +41,8 @@ class DualAxisTracker:
         update_interval = 60 if self.is_winter_mode_active else min_update_interval_minutes
         
         # Check if we need to update based on time
-        if self.last_update_time is not None:
-            time_diff = (dt_local - self.last_update_time).total_seconds() / 60.0
-            if time_diff < update_interval:
+        if self.last_update_minute is not None:
+            if minute - self.last_update_minute < update_interval:
                 return {
                     "action": "skip",
                     "reason": "Update interval not reached",
@@ -70,6 +84,7 @@ class DualAxisTracker:
         self.current_tilt = target_tilt
         self.current_azimuth = target_azimuth
         self.last_update_time = dt_local
+        self.last_update_minute = minute
         
         return {
             "action": action,
@@ -79,3 +94,71 @@ class DualAxisTracker:
             "zenith": optimal["zenith"],
             "solar_time": optimal["solar_time"]
         }
+
+
+class TrackerFarm:
+    """
+    Many DualAxisTracker sites stored as parallel arrays (one entry per site),
+    so a whole farm or parameter sweep is updated with a single vectorized call.
+    """
+    def __init__(self, latitudes, longitudes, utc_offsets_hours):
+        self.latitude, self.longitude, self.utc_offset = (
+            np.array(a, dtype=float) for a in np.broadcast_arrays(latitudes, longitudes, utc_offsets_hours)
+        )
+        n_sites = self.latitude.shape
+
+        # State
+        self.tilt = np.zeros(n_sites)
+        self.azimuth = np.zeros(n_sites)
+        self.last_update_minute = np.full(n_sites, np.nan) # NaN = never updated
+        self.is_winter_mode = np.zeros(n_sites, dtype=bool)
+
+    def update_all(self, dt_local: datetime, temperatures_c, snow_detected, min_update_interval_minutes: int = 10) -> Dict[str, Any]:
+        """
+        Same rules as DualAxisTracker.update, applied to every site at once.
+        temperatures_c and snow_detected are scalars or per-site arrays.
+        Returns the actuator commands as per-site arrays.
+        """
+        # Winter mode check
+        winter = (np.asarray(temperatures_c) < 2.0) & np.asarray(snow_detected, dtype=bool)
+        self.is_winter_mode = winter = np.broadcast_to(winter, self.tilt.shape).copy()
+
+        # Determine which sites are due for an update
+        # Same minute counter as DualAxisTracker.update (seconds included)
+        now_minute = dt_local.toordinal() * 1440 + dt_local.hour * 60 + dt_local.minute + dt_local.second / 60.0
+        update_interval = np.where(winter, 60, min_update_interval_minutes)
+        due = np.isnan(self.last_update_minute) | (now_minute - self.last_update_minute >= update_interval)
+
+        # Calculate optimal angles for every site (the date is shared, the site geometry is not)
+        n = get_day_of_year(dt_local)
+        local_time_hours = dt_local.hour + dt_local.minute / 60.0 + dt_local.second / 3600.0
+        solar_time = (local_time_hours + solar_time_correction(self.longitude, self.utc_offset, n) / 60.0) % 24
+        zenith, optimal_azimuth = zenith_and_azimuth_array(self.latitude, solar_declination(n), hour_angle(solar_time))
+
+        # Apply Winter Mode Optimization (raise tilt, hold azimuth)
+        target_tilt = np.where(winter, np.maximum(zenith, 65.0), zenith)
+        target_azimuth = np.where(winter, self.azimuth, optimal_azimuth)
+
+        # Night mode: stow flat facing South, or stay tilted to shed snow
+        night = zenith > 90.0
+        target_tilt = np.where(night, np.where(winter, 65.0, 0.0), target_tilt)
+        target_azimuth = np.where(night, 180.0, target_azimuth)
+
+        # Limit constraints
+        target_tilt = np.clip(target_tilt, 0.0, 90.0)
+        target_azimuth = target_azimuth % 360.0
+
+        # Update state only where the interval has elapsed
+        self.tilt = np.where(due, target_tilt, self.tilt)
+        self.azimuth = np.where(due, target_azimuth, self.azimuth)
+        self.last_update_minute = np.where(due, now_minute, self.last_update_minute)
+
+        action = np.select([~due, night, winter], ["skip", "stow", "winter_optimized"], default="track")
+        return {
+            "action": action,
+            "tilt": self.tilt,
+            "azimuth": self.azimuth,
+            "winter_mode": self.is_winter_mode,
+            "zenith": zenith,
+            "solar_time": solar_time
+        }
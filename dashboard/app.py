@@ -12,6 +12,11 @@ from simulation.simulator import simulate_day
 
 st.set_page_config(page_title="Intelligent Solar Tracker Dashboard", layout="wide")
 
+@st.cache_data(ttl=3600, max_entries=64)
+def cached_simulate(date, lat, lon, utc_offset, temp_tuple, snow):
+    # Cached on the raw simulation inputs only; area/efficiency scaling is applied afterwards
+    return simulate_day(date, lat, lon, utc_offset, list(temp_tuple), snow)
+
 st.title("☀️ Intelligent Dual-Axis Solar Tracking System")
 st.markdown("### Location-Specific Tracker with Winter Optimization & Edge AI")
 
@@ -29,20 +34,23 @@ avg_temp = st.sidebar.slider("Average Temp (°C)", min_value=-20, max_value=45,
 temp_profile = [avg_temp] * 24 # Simplified constant temp for simulation
 snow_detected = st.sidebar.checkbox("Snow Detected", value=True)
 
-st.sidebar.markdown("---")
-st.sidebar.header("Tracker Specs")
-panel_area = st.sidebar.number_input("Totale Area (m²)", value=10.0)
-efficiency = st.sidebar.slider("Panel Efficiency (%)", 10, 25, 20) / 100.0
+@st.fragment
+def simulation_panel(lat, lon, utc_offset, date_input, temp_profile, snow_detected):
+    # Rendered as a fragment: the tracker specs only rescale the results, so changing them
+    # reruns just this panel and the simulation itself comes from cached_simulate
+    st.header("Tracker Specs")
+    spec1, spec2 = st.columns(2)
+    panel_area = spec1.number_input("Totale Area (m²)", value=10.0)
+    efficiency = spec2.slider("Panel Efficiency (%)", 10, 25, 20) / 100.0
 
-if st.sidebar.button("Run Simulation"):
     with st.spinner("Simulating Dual-Axis tracking with Winter Optimization..."):
         # Run Simulation
-        df = simulate_day(date_input, lat, lon, utc_offset, temp_profile, snow_detected)
+        df = cached_simulate(date_input, lat, lon, utc_offset, tuple(temp_profile), snow_detected)
         
         # Adjust power to actual energy based on area and efficiency
-        df["Power_Dual_W"] = df["Power_Dual"] * panel_area * efficiency
-        df["Power_Single_W"] = df["Power_Single"] * panel_area * efficiency
-        df["Power_Fixed_W"] = df["Power_Fixed"] * panel_area * efficiency
+        df["Power_Dual_W"] = df["Power_Dual"].to_numpy() * panel_area * efficiency
+        df["Power_Single_W"] = df["Power_Single"].to_numpy() * panel_area * efficiency
+        df["Power_Fixed_W"] = df["Power_Fixed"].to_numpy() * panel_area * efficiency
         
         st.subheader(f"Tracker Behavior Analysis for {date_input}")
         
@@ -61,9 +69,10 @@ if st.sidebar.button("Run Simulation"):
         st.header("Sustainability & Energy Modeling")
         
         # Energy integrates power over 10 min intervals (1/6 hour)
-        energy_dual = df["Power_Dual_W"].sum() * (10 / 60) / 1000.0  # kWh
-        energy_single = df["Power_Single_W"].sum() * (10 / 60) / 1000.0 # kWh
-        energy_fixed = df["Power_Fixed_W"].sum() * (10 / 60) / 1000.0 # kWh
+        # Plain ndarray sums: the columns have no NaNs, so pandas' NaN-skipping pass isn't needed
+        energy_dual = df["Power_Dual_W"].to_numpy().sum() * (10 / 60) / 1000.0  # kWh
+        energy_single = df["Power_Single_W"].to_numpy().sum() * (10 / 60) / 1000.0 # kWh
+        energy_fixed = df["Power_Fixed_W"].to_numpy().sum() * (10 / 60) / 1000.0 # kWh
         
         gain_vs_fixed = (energy_dual - energy_fixed) / energy_fixed * 100 if energy_fixed > 0 else 0
         gain_vs_single = (energy_dual - energy_single) / energy_single * 100 if energy_single > 0 else 0
@@ -80,6 +89,8 @@ if st.sidebar.button("Run Simulation"):
         st.markdown(f"**Status:** Winter Mode triggered: `{(df['Is_Winter'] == True).any()}`")
         if (df['Is_Winter'] == True).any():
             st.success("❄️ Winter Optimization Active: Tilt increased to shed snow, azimuth locked to save actuator energy.")
-            
+
+if st.sidebar.button("Run Simulation"):
+    simulation_panel(lat, lon, utc_offset, date_input, temp_profile, snow_detected)
 else:
     st.info("Configure the parameters in the sidebar and click 'Run Simulation'.")
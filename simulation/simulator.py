@@ -1,77 +1,128 @@
 import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
-from core.solar_model import get_target_angles
-from core.tracking_logic import DualAxisTracker
+from datetime import datetime
+from core.solar_model import make_angle_solver
 
-def simulate_day(date_obj: datetime, lat: float, lon: float, utc_offset: float, 
-                 temps: list[float], snow_detected: bool, 
+def _incident_power(irradiance: np.ndarray, cos_tilt: np.ndarray, cos_azimuth) -> np.ndarray:
+    """Received power: irradiance * max(0, cos_tilt * cos_azimuth)."""
+    return irradiance * np.maximum(0.0, cos_tilt * cos_azimuth)
+
+def _dual_axis_schedule(minutes: np.ndarray, winter: np.ndarray, opt_tilt: np.ndarray,
+                        opt_azimuth: np.ndarray, zenith: np.ndarray,
+                        min_update_interval_minutes: int = 10) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Replays DualAxisTracker.update over a full day of timesteps using arrays.
+    Returns the (tilt, azimuth) the actuators hold at every timestep.
+    """
+    # Only the update cadence is stateful (Winter Mode stretches it to 60 minutes)
+    interval = np.where(winter, 60, min_update_interval_minutes)
+    updated = np.zeros(len(minutes), dtype=bool)
+    last_update = None
+    for i, m in enumerate(minutes):
+        if last_update is None or m - last_update >= interval[i]:
+            updated[i] = True
+            last_update = m
+
+    night = zenith > 90.0
+    idx = np.arange(len(minutes))
+
+    # Tilt: Winter Mode raises it to shed snow, Stow lays it flat (or 65 deg with snow)
+    tilt = np.where(winter, np.maximum(opt_tilt, 65.0), opt_tilt)
+    tilt = np.where(night, np.where(winter, 65.0, 0.0), tilt)
+    tilt = np.clip(tilt, 0.0, 90.0)
+    last_tilt = np.maximum.accumulate(np.where(updated, idx, -1))
+    tilt = np.where(last_tilt >= 0, tilt[np.maximum(last_tilt, 0)], 0.0)
+
+    # Azimuth: Winter Mode keeps the current azimuth, so carry the last one actually set
+    azimuth = np.where(night, 180.0, opt_azimuth % 360.0)
+    az_set = updated & (night | ~winter)
+    last_az = np.maximum.accumulate(np.where(az_set, idx, -1))
+    azimuth = np.where(last_az >= 0, azimuth[np.maximum(last_az, 0)], 0.0)
+
+    return tilt, azimuth
+
+def simulate_day(date_obj: datetime, lat: float, lon: float, utc_offset: float,
+                 temps: list[float], snow_detected: bool,
                  fixed_tilt: float = 30.0, fixed_azimuth: float = 180.0):
     """
     Simulates solar tracking over a single 24-hour period.
     Returns a DataFrame with minute-by-minute (or 10-minute) tracking and energy data.
     """
-    tracker = DualAxisTracker(lat, lon, utc_offset)
-    
-    records = []
-    
     # Simulate every 10 minutes
     start_of_day = datetime(date_obj.year, date_obj.month, date_obj.day, 0, 0, 0)
-    
-    for minutes in range(0, 24 * 60, 10):
-        current_time = start_of_day + timedelta(minutes=minutes)
-        hour_frac = current_time.hour + current_time.minute / 60.0
-        
-        # Interpolate temperature (assuming temps is a list of 24 hourly values)
-        hour_int = int(current_time.hour)
-        temp_now = temps[hour_int] if hour_int < len(temps) else temps[-1]
-        
-        # 1. Optimal Geometry
-        optimal = get_target_angles(current_time, lat, lon, utc_offset)
-        zenith = optimal["zenith"]
-        
-        # Base Irradiance Model (simplified clear sky)
-        # Max 1000 W/m^2 at zenith 0
-        if zenith < 90:
-            irradiance_direct = 1000 * np.cos(np.radians(zenith))
-        else:
-            irradiance_direct = 0.0
-            
-        # 2. Dual-Axis Tracking Logic (includes Winter Mode)
-        tracker_state = tracker.update(current_time, temp_now, snow_detected, 10)
-        dual_tilt = tracker_state["tilt"]
-        dual_azimuth = tracker_state["azimuth"]
-        is_winter = tracker_state["winter_mode"]
-        
-        # Calculate received power for Dual-Axis
-        # Ideal dual-axis always faces the sun perfectly when not in winter/stow mode
-        # If in winter mode or stow, we must calculate the cosine loss.
-        dual_inc_cos = max(0.0, np.cos(np.radians(optimal["tilt"] - dual_tilt)) * np.cos(np.radians(optimal["azimuth"] - dual_azimuth)))
-        dual_power = irradiance_direct * dual_inc_cos
-        
-        # 3. Fixed-Axis Logic
-        fixed_inc_cos = max(0.0, np.cos(np.radians(optimal["tilt"] - fixed_tilt)) * np.cos(np.radians(optimal["azimuth"] - fixed_azimuth)))
-        fixed_power = irradiance_direct * fixed_inc_cos
-        
-        # 4. Single-Axis Logic (Vertical axis tracking: optimal azimuth, fixed tilt)
-        single_inc_cos = max(0.0, np.cos(np.radians(optimal["tilt"] - fixed_tilt)))
-        single_power = irradiance_direct * single_inc_cos
-        
-        records.append({
-            "Time": current_time,
-            "Hour": hour_frac,
-            "Zenith": zenith,
-            "Opt_Tilt": optimal["tilt"],
-            "Opt_Azimuth": optimal["azimuth"],
-            "Dual_Tilt": dual_tilt,
-            "Dual_Azimuth": dual_azimuth,
-            "Is_Winter": is_winter,
-            "Temp_C": temp_now,
-            "Irradiance_W_m2": irradiance_direct,
-            "Power_Dual": dual_power,
-            "Power_Single": single_power,
-            "Power_Fixed": fixed_power
-        })
-        
-    df = pd.DataFrame(records)
+    times = pd.date_range(start_of_day, periods=24 * 6, freq="10min")
+    minutes = times.hour.to_numpy() * 60 + times.minute.to_numpy()
+    hour_frac = minutes / 60.0
+
+    # Temperature lookup (assuming temps is a list of 24 hourly values)
+    temps_arr = np.asarray(temps)
+    temp_now = temps_arr[np.minimum(minutes // 60, len(temps_arr) - 1)]
+
+    # 1. Optimal Geometry (solver specialized to this site and day)
+    solve_angles = make_angle_solver(lat, lon, utc_offset, start_of_day)
+    opt_tilt, azimuth, zenith = solve_angles(hour_frac)
+
+    # Base Irradiance Model (simplified clear sky)
+    # Max 1000 W/m^2 at zenith 0, nothing at night
+    is_day = zenith < 90
+    irradiance_direct = np.zeros_like(zenith)
+    irradiance_direct[is_day] = 1000 * np.cos(np.radians(zenith[is_day]))
+
+    # 2. Dual-Axis Tracking Logic (includes Winter Mode)
+    is_winter = (temp_now < 2.0) & bool(snow_detected)
+    dual_tilt, dual_azimuth = _dual_axis_schedule(minutes, is_winter, opt_tilt, azimuth, zenith, 10)
+
+    # Night timesteps receive no power, so the incidence maths below only runs on daylight rows.
+    # The three set-ups share the radian conversion of the optimal angles and the fixed-tilt cosine
+    irradiance_day = irradiance_direct[is_day]
+    opt_tilt_rad = np.radians(opt_tilt[is_day])
+    opt_az_rad = np.radians(azimuth[is_day])
+    cos_tilt_fixed = np.cos(opt_tilt_rad - np.radians(fixed_tilt))
+    dual_power = np.zeros_like(zenith)
+    fixed_power = np.zeros_like(zenith)
+    single_power = np.zeros_like(zenith)
+
+    # Calculate received power for Dual-Axis
+    # Ideal dual-axis always faces the sun perfectly when not in winter/stow mode
+    # If in winter mode or stow, we must calculate the cosine loss.
+    dual_power[is_day] = _incident_power(irradiance_day, np.cos(opt_tilt_rad - np.radians(dual_tilt[is_day])),
+                                         np.cos(opt_az_rad - np.radians(dual_azimuth[is_day])))
+
+    # 3. Fixed-Axis Logic
+    fixed_power[is_day] = _incident_power(irradiance_day, cos_tilt_fixed, np.cos(opt_az_rad - np.radians(fixed_azimuth)))
+
+    # 4. Single-Axis Logic (Vertical axis tracking: optimal azimuth, fixed tilt)
+    single_power[is_day] = _incident_power(irradiance_day, cos_tilt_fixed, 1.0)
+
+    df = pd.DataFrame({
+        "Time": times,
+        "Hour": hour_frac,
+        "Zenith": zenith,
+        "Opt_Tilt": opt_tilt,
+        "Opt_Azimuth": azimuth,
+        "Dual_Tilt": dual_tilt,
+        "Dual_Azimuth": dual_azimuth,
+        "Is_Winter": is_winter,
+        "Temp_C": temp_now,
+        "Irradiance_W_m2": irradiance_direct,
+        "Power_Dual": dual_power,
+        "Power_Single": single_power,
+        "Power_Fixed": fixed_power
+    })
     return df
+
+def simulate_year(dates, lat: float, lon: float, utc_offset: float,
+                  temps: list[float], snow_detected: bool,
+                  fixed_tilt: float = 30.0, fixed_azimuth: float = 180.0, n_jobs: int = -1):
+    """
+    Runs simulate_day for every date in `dates` (e.g. a year of days) across CPU cores.
+    Days are independent, so they are farmed out with joblib and concatenated in date order.
+    """
+    # Imported here so single-day callers (e.g. the dashboard) don't pay for it
+    from joblib import Parallel, delayed
+
+    days = Parallel(n_jobs=n_jobs, backend="loky")(
+        delayed(simulate_day)(d, lat, lon, utc_offset, temps, snow_detected, fixed_tilt, fixed_azimuth)
+        for d in dates
+    )
+    return pd.concat(days, ignore_index=True)